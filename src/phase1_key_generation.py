@@ -31,16 +31,249 @@ DAILY RELEVANCE:
 """
 
 import os
-import json
+import ctypes
+import logging
+import threading
+from dataclasses import dataclass, asdict
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
+import msgpack
 import oqs  # liboqs-python bindings
 
+import verbosity
+
 console = Console()
+log = logging.getLogger(__name__)
+
+# liboqs OQS_CPU_EXT enum (src/common/common.h), in declaration order
+_OQS_CPU_EXTENSIONS = [
+    "ADX", "AES", "AVX", "AVX2", "AVX512", "BMI1", "BMI2", "PCLMULQDQ",
+    "VPCLMULQDQ", "POPCNT", "SSE", "SSE2", "SSE3",
+    "ARM_AES", "ARM_SHA2", "ARM_SHA3", "ARM_NEON",
+]
+
+
+def report_oqs_build() -> dict:
+    """
+    Report which liboqs build backs `oqs.KeyEncapsulation` and which CPU
+    extensions its runtime dispatch detected (OQS_CPU_EXT_*).
+
+    A liboqs built with -DOQS_DIST_BUILD=ON selects the AVX2/AVX-512 NTT
+    code paths at runtime — roughly 6× faster keygen than a generic build.
+    See the Dockerfile at the project root for the pinned build.
+
+    Returns:
+        A dict with the liboqs / liboqs-python versions and the list of
+        detected CPU extensions (empty if the native query is unavailable).
+    """
+    build_info = {
+        "liboqs_version": oqs.oqs_version(),
+        "liboqs_python_version": oqs.oqs_python_version(),
+        "cpu_extensions": [],
+    }
+
+    native = getattr(oqs, "native", None)
+    if native is not None:
+        has_extension = getattr(native(), "OQS_CPU_has_extension", None)
+        if has_extension is not None:
+            build_info["cpu_extensions"] = [
+                name for index, name in enumerate(_OQS_CPU_EXTENSIONS, start=1)
+                if has_extension(index)
+            ]
+
+    extensions = ", ".join(build_info["cpu_extensions"]) or "unknown (generic build?)"
+    log.info("liboqs %s (liboqs-python %s), OQS_CPU_EXT: %s",
+             build_info["liboqs_version"], build_info["liboqs_python_version"], extensions)
+    if verbosity.VERBOSE:
+        console.print(
+            f"[dim]liboqs {build_info['liboqs_version']} "
+            f"(liboqs-python {build_info['liboqs_python_version']}) — "
+            f"OQS_CPU_EXT: {extensions}[/dim]"
+        )
+    return build_info
+
+
+# One set of liboqs contexts per thread — an OQS_KEM context is not thread-safe
+_KEM_LOCAL = threading.local()
+
+
+class _KemCache(dict):
+    """
+    A thread's encapsulation contexts, keyed by algorithm.
+
+    `oqs.KeyEncapsulation` has no finalizer, so the native OQS_KEM is freed here
+    when the owning thread exits and its thread-local storage is dropped.
+    """
+
+    def __del__(self):
+        for kem in self.values():
+            kem.free()
+
+
+def get_kem(algorithm: str) -> oqs.KeyEncapsulation:
+    """
+    Return a long-lived, key-less `oqs.KeyEncapsulation` for this thread.
+
+    Creating a context allocates liboqs buffers and resolves the algorithm
+    through the dispatch table; caching it removes that overhead from every
+    encapsulation. Only public-key operations use the cache: key generation
+    and decapsulation bind a secret key to the context, so they use a `with`
+    block that cleanses and frees it as soon as the operation is done.
+
+    Args:
+        algorithm: ML-KEM variant, e.g. "ML-KEM-768".
+
+    Returns:
+        A cached KeyEncapsulation owned by the calling thread. Do not use it
+        as a context manager — exiting the `with` block frees the context.
+    """
+    cache = getattr(_KEM_LOCAL, "cache", None)
+    if cache is None:
+        cache = _KEM_LOCAL.cache = _KemCache()
+    kem = cache.get(algorithm)
+    if kem is None:
+        kem = cache[algorithm] = oqs.KeyEncapsulation(algorithm)
+    return kem
+
+
+def _c_buffer(buf: bytearray):
+    """Zero-copy ctypes view of a writable buffer, for liboqs output arguments."""
+    return (ctypes.c_ubyte * len(buf)).from_buffer(buf)
+
+
+def _c_input(data):
+    """liboqs input argument: `bytes` as-is, writable buffers as a zero-copy view."""
+    if isinstance(data, bytes):
+        return data
+    try:
+        return _c_buffer(data)
+    except TypeError:   # read-only buffer (e.g. a memoryview of bytes): copy once
+        return bytes(data)
+
+
+def _check_length(kem: oqs.KeyEncapsulation, name: str, data, detail: str):
+    """
+    Raise ValueError unless `data` is exactly `kem.details[detail]` bytes.
+
+    liboqs reads and writes fixed-size buffers with no length argument, so a
+    truncated key / ciphertext or an undersized output buffer would otherwise
+    be read or written out of bounds in native code.
+    """
+    expected = kem.details[detail]
+    actual = memoryview(data).nbytes
+    if actual != expected:
+        raise ValueError(f"{name} is {actual} bytes; {kem.details['name']} expects {expected}")
+
+
+def _native_kem(kem: oqs.KeyEncapsulation):
+    """(liboqs CDLL, OQS_KEM*) for `kem`, or None when the binding hides them."""
+    native = getattr(oqs, "native", None)
+    handle = getattr(kem, "_kem", None)
+    if native is None or handle is None:
+        return None
+    return native(), handle
+
+
+def encap_secret_into(kem: oqs.KeyEncapsulation, public_key: bytes,
+                      ciphertext_buf: bytearray, shared_secret_buf: bytearray):
+    """
+    `kem.encap_secret(public_key)`, writing into caller-owned buffers.
+
+    Calls liboqs' `OQS_KEM_encaps(kem, ct, ss, pk)` directly so the ciphertext
+    and shared secret land in `ciphertext_buf` / `shared_secret_buf` (sized from
+    `kem.details`) instead of intermediate ctypes buffers copied into new
+    `bytes`. Falls back to the copying binding if the native handle is hidden.
 
+    Raises:
+        ValueError: If the public key or either buffer does not match the
+                    sizes in `kem.details`.
+    """
+    _check_length(kem, "public key", public_key, "length_public_key")
+    _check_length(kem, "ciphertext buffer", ciphertext_buf, "length_ciphertext")
+    _check_length(kem, "shared secret buffer", shared_secret_buf, "length_shared_secret")
+    native_kem = _native_kem(kem)
+    if native_kem is None:
+        ciphertext, shared_secret = kem.encap_secret(public_key)
+        ciphertext_buf[:] = ciphertext
+        shared_secret_buf[:] = shared_secret
+        return
+    lib, handle = native_kem
+    rv = lib.OQS_KEM_encaps(handle, _c_buffer(ciphertext_buf), _c_buffer(shared_secret_buf),
+                            _c_input(public_key))
+    if rv != oqs.OQS_SUCCESS:
+        raise RuntimeError(f"OQS_KEM_encaps failed for {kem.details['name']}")
+
+
+def decap_secret_into(kem: oqs.KeyEncapsulation, ciphertext: bytes,
+                      shared_secret_buf: bytearray):
+    """
+    `kem.decap_secret(ciphertext)`, writing into a caller-owned buffer.
+
+    Raises:
+        ValueError: If the ciphertext, the bound secret key or the buffer does
+                    not match the sizes in `kem.details`.
+    """
+    _check_length(kem, "ciphertext", ciphertext, "length_ciphertext")
+    _check_length(kem, "shared secret buffer", shared_secret_buf, "length_shared_secret")
+    native_kem = _native_kem(kem)
+    if native_kem is None:
+        shared_secret_buf[:] = kem.decap_secret(ciphertext)
+        return
+    lib, handle = native_kem
+    _check_length(kem, "secret key", kem.secret_key, "length_secret_key")
+    rv = lib.OQS_KEM_decaps(handle, _c_buffer(shared_secret_buf), _c_input(ciphertext),
+                            kem.secret_key)
+    if rv != oqs.OQS_SUCCESS:
+        raise RuntimeError(f"OQS_KEM_decaps failed for {kem.details['name']}")
+
+
+@dataclass(frozen=True)
+class Keyring:
+    """
+    Raw ML-KEM key material for one observation-post key pair.
+
+    Keys are held as `bytes` end to end, exactly as liboqs returns and consumes
+    them, so no hex encoding happens between key generation and the KEM ops.
+    """
+    public_key: bytes    # Shared with sender (generator station)
+    private_key: bytes   # Kept secret at observation post
+    algorithm: str = "ML-KEM-768"
+    nist_level: int = 3
 
-def generate_mlkem_keypair(security_level: str = "ML-KEM-768") -> dict:
+    @property
+    def public_key_bytes(self) -> int:
+        return len(self.public_key)
+
+    @property
+    def private_key_bytes(self) -> int:
+        return len(self.private_key)
+
+
+def save_key_data(keyring, path: str = "output/keys.msgpack"):
+    """
+    Persist key material (a Keyring or a list of them) as msgpack.
+
+    Keys stay raw binary on disk — no hex inflation, no text parsing on load.
+    """
+    if isinstance(keyring, Keyring):
+        record = asdict(keyring)
+    else:
+        record = [asdict(k) for k in keyring]
+    with open(path, "wb") as f:
+        f.write(msgpack.packb(record, use_bin_type=True))
+
+
+def load_key_data(path: str = "output/keys.msgpack"):
+    """Load the Keyring (or list of Keyrings) written by `save_key_data`."""
+    with open(path, "rb") as f:
+        record = msgpack.unpackb(f.read(), raw=False)
+    if isinstance(record, list):
+        return [Keyring(**entry) for entry in record]
+    return Keyring(**record)
+
+
+def generate_mlkem_keypair(security_level: str = "ML-KEM-768") -> Keyring:
     """
     Generate an ML-KEM key pair for the observation post (server).
 
@@ -53,38 +286,42 @@ def generate_mlkem_keypair(security_level: str = "ML-KEM-768") -> dict:
         security_level: The ML-KEM parameter set to use.
 
     Returns:
-        A dict containing the public key, private key, and metadata.
+        A Keyring holding the raw public key, private key, and algorithm.
     """
-    console.print(Panel(
-        f"[bold cyan]Initializing ML-KEM Key Pair Generation[/bold cyan]\n"
-        f"Algorithm: [yellow]{security_level}[/yellow]\n"
-        f"Security Level: NIST Level 3 (≈ AES-192 classical equivalent)\n"
-        f"Quantum Threat Model: Resistant to Grover + Shor algorithms",
-        title="[bold green]PHASE 1 — Key Generation[/bold green]",
-        border_style="green"
-    ))
+    if verbosity.VERBOSE:
+        console.print(Panel(
+            f"[bold cyan]Initializing ML-KEM Key Pair Generation[/bold cyan]\n"
+            f"Algorithm: [yellow]{security_level}[/yellow]\n"
+            f"Security Level: NIST Level 3 (≈ AES-192 classical equivalent)\n"
+            f"Quantum Threat Model: Resistant to Grover + Shor algorithms",
+            title="[bold green]PHASE 1 — Key Generation[/bold green]",
+            border_style="green"
+        ))
 
+    # The context holds the new secret key; leaving `with` cleanses and frees it
     with oqs.KeyEncapsulation(security_level) as kem:
         # Generate the public/private key pair
         public_key = kem.generate_keypair()
         private_key = kem.export_secret_key()
+    keyring = Keyring(public_key, private_key, security_level)
+    log.debug("Generated %s key pair (public %d bytes, private %d bytes)",
+              security_level, len(public_key), len(private_key))
+
+    if verbosity.VERBOSE:
+        _display_key_metrics(keyring)
+
+    return keyring
 
-        key_data = {
-            "algorithm": security_level,
-            "public_key": public_key.hex(),    # Shared with sender (generator station)
-            "private_key": private_key.hex(),  # Kept secret at observation post
-            "public_key_bytes": len(public_key),
-            "private_key_bytes": len(private_key),
-            "nist_level": 3,
-        }
 
-    # Display key statistics
+def _display_key_metrics(keyring: Keyring):
+    """Print the key statistics table and the ephemeral-key (PFS) note."""
     table = Table(title="ML-KEM Key Metrics", border_style="cyan")
     table.add_column("Property", style="bold white")
     table.add_column("Value", style="yellow")
-    table.add_row("Algorithm", key_data["algorithm"])
-    table.add_row("Public Key Size", f"{key_data['public_key_bytes']} bytes ({key_data['public_key_bytes'] * 8} bits)")
-    table.add_row("Private Key Size", f"{key_data['private_key_bytes']} bytes")
+    table.add_row("Algorithm", keyring.algorithm)
+    table.add_row("Public Key Size",
+                  f"{keyring.public_key_bytes} bytes ({keyring.public_key_bytes * 8} bits)")
+    table.add_row("Private Key Size", f"{keyring.private_key_bytes} bytes")
     table.add_row("SVP Hardness (estimated)", "≥ 2^178 classical operations")
     table.add_row("Quantum Resistance", "✓ Grover's speedup limited to √ search space")
     table.add_row("Key Type", "EPHEMERAL (generated fresh per session)")
@@ -97,7 +334,61 @@ def generate_mlkem_keypair(security_level: str = "ML-KEM-768") -> dict:
         "This property is called [bold]Perfect Forward Secrecy (PFS)[/bold].\n"
     )
 
-    return key_data
+
+def generate_mlkem_keypairs_batch(n: int, security_level: str = "ML-KEM-768") -> list:
+    """
+    Generate `n` independent ML-KEM key pairs, e.g. to pre-mint ephemeral keys
+    for many PFS sessions.
+
+    One `oqs.KeyEncapsulation` context is used for the whole batch; each
+    `generate_keypair()` call overwrites the context's secret key, so the pairs
+    remain independent while context setup is paid once. The context is freed
+    (and its last secret key cleansed) when the batch is done.
+
+    Args:
+        n:              Number of key pairs to generate.
+        security_level: The ML-KEM parameter set to use.
+
+    Returns:
+        A list of `n` Keyrings, as returned by `generate_mlkem_keypair`.
+    """
+    if n < 1:
+        raise ValueError(f"batch size must be >= 1, got {n}")
+
+    if verbosity.VERBOSE:
+        console.print(Panel(
+            f"[bold cyan]Batch ML-KEM Key Pair Generation[/bold cyan]\n"
+            f"Algorithm: [yellow]{security_level}[/yellow]\n"
+            f"Key Pairs: [yellow]{n}[/yellow] (one ephemeral pair per session)",
+            title="[bold green]PHASE 1 — Key Generation (Batch)[/bold green]",
+            border_style="green"
+        ))
+
+    batch = []
+    with oqs.KeyEncapsulation(security_level) as kem:
+        for _ in range(n):
+            public_key = kem.generate_keypair()
+            private_key = kem.export_secret_key()
+            batch.append(Keyring(public_key, private_key, security_level))
+
+    log.debug("Generated batch of %d %s key pairs", n, security_level)
+
+    if verbosity.VERBOSE:
+        table = Table(title=f"ML-KEM Key Batch ({n} pairs)", border_style="cyan")
+        table.add_column("#", style="bold white")
+        table.add_column("Algorithm", style="cyan")
+        table.add_column("Public Key (prefix)", style="yellow")
+        table.add_column("Public / Private Size", style="yellow")
+        for index, keyring in enumerate(batch):
+            table.add_row(
+                str(index),
+                keyring.algorithm,
+                f"{keyring.public_key[:8].hex()}...",
+                f"{keyring.public_key_bytes} / {keyring.private_key_bytes} bytes",
+            )
+        console.print(table)
+
+    return batch
 
 
 def lattice_geometry_explainer():
@@ -121,14 +412,26 @@ def lattice_geometry_explainer():
 
 
 if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Project Icarus — Phase 1: Key Generation")
+    parser.add_argument("--batch", type=int, metavar="N",
+                        help="Generate N ephemeral key pairs (saved to output/keys_batch.msgpack)")
+    args = parser.parse_args()
+
     console.print("\n[bold white on blue]  PROJECT ICARUS — PHASE 1  [/bold white on blue]\n")
+    report_oqs_build()
     lattice_geometry_explainer()
-    key_data = generate_mlkem_keypair("ML-KEM-768")
 
     # Persist keys for use in subsequent phases
     os.makedirs("output", exist_ok=True)
-    with open("output/keys.json", "w") as f:
-        json.dump(key_data, f, indent=2)
-
-    console.print("[bold green]✓ Keys saved to output/keys.json[/bold green]")
+    if args.batch:
+        batch = generate_mlkem_keypairs_batch(args.batch, "ML-KEM-768")
+        save_key_data(batch, "output/keys_batch.msgpack")
+        console.print(f"[bold green]✓ {len(batch)} key pairs saved to "
+                      f"output/keys_batch.msgpack[/bold green]")
+    else:
+        keyring = generate_mlkem_keypair("ML-KEM-768")
+        save_key_data(keyring)
+        console.print("[bold green]✓ Keys saved to output/keys.msgpack[/bold green]")
     console.print("[dim]Ready for Phase 2: Telemetry Payload Generation[/dim]\n")
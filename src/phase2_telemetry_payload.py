@@ -37,11 +37,19 @@ import numpy as np
 import json
 import time
 import hashlib
+import struct
+import functools
+import threading
 from typing import Tuple
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
+try:
+    import orjson
+except ImportError:  # stdlib json fallback for portability; same bytes, just slower
+    orjson = None
+
 console = Console()
 
 # ─────────────────────────────────────────────────────────────
@@ -51,18 +59,94 @@ G_NEWTON       = 6.674e-11   # m³ kg⁻¹ s⁻²  (nominal Newton's G)
 C_LIGHT        = 2.998e8     # m/s
 REDUCTION_EPS  = 0.073       # 7.3% local reduction in G (simulated)
 
+# orjson serializes the ndarray tensors natively; sorted keys keep the bytes stable
+_ORJSON_OPTS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_SORT_KEYS if orjson is not None else 0
+
+# Flat-space Minkowski metric η_μν — constant, so built once and frozen
+_ETA = np.diag([-1.0, 1.0, 1.0, 1.0])
+_ETA.setflags(write=False)
+
+# (row, col) indices of the strictly-upper spatial block (xy, xz, yz)
+_SPATIAL_UPPER = np.triu_indices(3, k=1)
+
+# Per-thread {seed: (Generator, initial state)} — Generators are not thread-safe
+_RNG_POOL = threading.local()
+_RNG_POOL_SIZE = 16
+
+
+def _seeded_rng(seed: int) -> np.random.Generator:
+    """
+    Return this thread's PCG64DXSM Generator for `seed`, rewound to its start.
+
+    Seeding runs SeedSequence hashing on every `default_rng(seed)` call; here
+    it runs once per seed, and later calls just restore the saved state, so
+    each call still draws the same repeatable stream. `seed=None` means fresh
+    OS entropy on every call, so it bypasses the cache.
+    """
+    if seed is None:
+        return np.random.Generator(np.random.PCG64DXSM())
+    cache = getattr(_RNG_POOL, "cache", None)
+    if cache is None:
+        cache = _RNG_POOL.cache = {}
+    entry = cache.get(seed)
+    if entry is None:
+        if len(cache) >= _RNG_POOL_SIZE:
+            cache.pop(next(iter(cache)))   # evict the oldest seed
+        bit_generator = np.random.PCG64DXSM(seed)
+        entry = cache[seed] = (np.random.Generator(bit_generator), bit_generator.state)
+    rng, initial_state = entry
+    rng.bit_generator.state = initial_state
+    return rng
+
 
 def minkowski_metric() -> np.ndarray:
     """
     Returns the flat-space Minkowski metric tensor η_μν.
     Signature: (−, +, +, +)  — physics convention.
+
+    The returned array is a shared read-only constant; copy it before mutating.
+    """
+    return _ETA
+
+
+def _fill_spatial_block(delta_g: np.ndarray, uniforms_diag: np.ndarray,
+                        uniforms_off: np.ndarray, epsilon: float) -> np.ndarray:
     """
-    return np.diag([-1.0, 1.0, 1.0, 1.0])
+    Write the symmetric spatial block of δgμν from pre-drawn uniforms.
+
+    Explicit loops so Numba can compile it to a straight-line native kernel;
+    `uniforms_off` is consumed in (xy, xz, yz) order, matching `_SPATIAL_UPPER`.
+    """
+    k = 0
+    for i in range(1, 4):
+        delta_g[i, i] = epsilon * uniforms_diag[i - 1]
+        for j in range(i + 1, 4):
+            delta_g[i, j] = epsilon * uniforms_off[k]
+            delta_g[j, i] = delta_g[i, j]
+            k += 1
+    return delta_g
+
+
+@functools.lru_cache(maxsize=None)
+def _jit_spatial_block():
+    """
+    Numba-compiled `_fill_spatial_block`, or None without numba.
+
+    numba is optional (`uv sync --extra jit`) and imported here, on the first
+    `jit=True` call, so single-shot runs never pay its import or compile cost.
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+    return njit(cache=True, fastmath=True)(_fill_spatial_block)
 
 
 def delta_g_perturbation(
     epsilon: float = REDUCTION_EPS,
-    seed: int = 42
+    seed: int = 42,
+    legacy: bool = False,
+    jit: bool = False,
 ) -> np.ndarray:
     """
     Compute the metric perturbation tensor δgμν for a localized G-reduction event.
@@ -72,15 +156,24 @@ def delta_g_perturbation(
 
     Args:
         epsilon: Fractional reduction in G (0 → no effect, 1 → G = 0).
-        seed:    Random seed for repeatable simulated noise.
+        seed:    Random seed for repeatable simulated noise (None → fresh noise per call).
+        legacy:  Draw the noise one scalar at a time from `default_rng(seed)`
+                 (PCG64) in the original order, reproducing the tensors
+                 generated before vectorization.
+        jit:     Fill the spatial block with the Numba kernel. Only pays off for
+                 telemetry-rate loops in one process: the first call costs the
+                 numba import and compile (~0.3 s) against a few µs saved per
+                 call. Falls back to NumPy when numba is not installed.
 
     Returns:
         4×4 numpy array representing δgμν.
     """
-    rng = np.random.default_rng(seed)
-
-    # Base perturbation: purely gravitational (time-time component dominant)
-    delta_g = np.zeros((4, 4))
+    # Base perturbation: purely gravitational (time-time component dominant).
+    # np.empty skips the memset: only the time-space cross terms are zeroed here,
+    # the spatial block is fully overwritten below.
+    delta_g = np.empty((4, 4))
+    delta_g[0, :] = 0.0
+    delta_g[:, 0] = 0.0
 
     # g_tt perturbation encodes the G-reduction:
     #   In the Newtonian limit: g_tt ≈ -(1 + 2Φ/c²), Φ = -GM/r
@@ -88,16 +181,52 @@ def delta_g_perturbation(
     delta_g[0, 0] = -epsilon * 2.0 * G_NEWTON / C_LIGHT**2 * 1e12  # scaled for readability
 
     # Spatial off-diagonal components: frame-dragging signature of the generator
-    for i in range(1, 4):
-        for j in range(1, 4):
-            if i == j:
-                delta_g[i, j] = epsilon * rng.uniform(0.01, 0.05)
-            else:
-                delta_g[i, j] = delta_g[j, i] = epsilon * rng.uniform(-0.01, 0.01)
+    if legacy:
+        rng = np.random.default_rng(seed)
+        for i in range(1, 4):
+            for j in range(1, 4):
+                if i == j:
+                    delta_g[i, j] = epsilon * rng.uniform(0.01, 0.05)
+                else:
+                    delta_g[i, j] = delta_g[j, i] = epsilon * rng.uniform(-0.01, 0.01)
+        return delta_g
+
+    rng = _seeded_rng(seed)
+    off_diag = rng.uniform(-0.01, 0.01, size=3)
+    diag     = rng.uniform(0.01, 0.05, size=3)
+    kernel = _jit_spatial_block() if jit else None
+    if kernel is not None:
+        return kernel(delta_g, diag, off_diag, epsilon)
+
+    spatial = np.empty((3, 3))
+    spatial[_SPATIAL_UPPER] = off_diag
+    spatial[_SPATIAL_UPPER[::-1]] = off_diag   # mirror → δgμν = δgνμ
+    np.fill_diagonal(spatial, diag)
+    delta_g[1:, 1:] = epsilon * spatial
 
     return delta_g
 
 
+def physics_fingerprint_bytes(eta: np.ndarray, delta: np.ndarray,
+                              g_perturbed: np.ndarray) -> bytes:
+    """
+    Canonical byte encoding of the physics block that the integrity hash covers.
+
+    Field order (all little-endian IEEE-754 float64, tensors row-major):
+        minkowski_eta[4×4] ‖ delta_g_perturb[4×4] ‖ g_perturbed[4×4]
+        ‖ G_nominal ‖ G_local ‖ reduction_epsilon
+
+    The constant `tensor_note` string is not hashed. A verifier rebuilds the
+    arrays from the JSON lists with `np.array(...)` and recomputes the hash.
+    """
+    return b"".join([
+        np.ascontiguousarray(eta, dtype="<f8").tobytes(),
+        np.ascontiguousarray(delta, dtype="<f8").tobytes(),
+        np.ascontiguousarray(g_perturbed, dtype="<f8").tobytes(),
+        struct.pack("<ddd", G_NEWTON, G_NEWTON * (1 - REDUCTION_EPS), REDUCTION_EPS),
+    ])
+
+
 def build_telemetry_payload(
     station_id: str = "ICARUS-GEN-ALPHA",
     coordinates: Tuple[float, float, float] = (-10.234, 84.571, 3820.0),
@@ -112,14 +241,15 @@ def build_telemetry_payload(
         timestamp:    Unix epoch of the measurement (defaults to now).
 
     Returns:
-        Serializable dictionary with all telemetry fields + integrity hash.
+        Dictionary with all telemetry fields + integrity hash. The physics
+        tensors are kept as ndarrays; use `serialize_payload` to encode it.
     """
     if timestamp is None:
         timestamp = time.time()
 
-    eta   = minkowski_metric()
+    eta   = _ETA
     delta = delta_g_perturbation(epsilon=REDUCTION_EPS)
-    g_perturbed = eta + delta
+    g_perturbed = _ETA + delta
 
     payload = {
         "station_id":       station_id,
@@ -135,9 +265,9 @@ def build_telemetry_payload(
             "G_nominal":         G_NEWTON,
             "G_local":           G_NEWTON * (1 - REDUCTION_EPS),
             "reduction_epsilon": REDUCTION_EPS,
-            "minkowski_eta":     eta.tolist(),
-            "delta_g_perturb":   delta.tolist(),
-            "g_perturbed":       g_perturbed.tolist(),
+            "minkowski_eta":     eta,
+            "delta_g_perturb":   delta,
+            "g_perturbed":       g_perturbed,
             "tensor_note": (
                 "δgμν represents the local spacetime curvature deviation. "
                 "Spatial index 0=t,1=x,2=y,3=z. Off-diagonal terms indicate "
@@ -157,13 +287,77 @@ def build_telemetry_payload(
         },
     }
 
-    # Compute SHA-3-256 integrity fingerprint of the physics data
-    raw = json.dumps(payload["physics"], sort_keys=True).encode()
-    payload["integrity_hash_sha3_256"] = hashlib.sha3_256(raw).hexdigest()
+    # Compute SHA-256 integrity fingerprint of the physics data
+    # (OpenSSL-backed hashlib uses SHA-NI / ARMv8 SHA2 instructions where present)
+    raw = physics_fingerprint_bytes(eta, delta, g_perturbed)
+    payload["integrity_hash_sha256"] = hashlib.sha256(raw).hexdigest()
 
     return payload
 
 
+def serialize_payload(payload: dict, pretty: bool = False) -> bytes:
+    """
+    Encode a telemetry payload to JSON bytes with orjson.
+
+    Tensors may be ndarrays (fresh from `build_telemetry_payload`) or nested
+    lists (loaded back from disk) — both produce the same JSON.
+
+    Args:
+        payload: Telemetry payload dict.
+        pretty:  Indent with two spaces (for the human-readable output file).
+    """
+    if orjson is None:
+        return json.dumps(payload, default=_json_default, sort_keys=True, ensure_ascii=False,
+                          indent=2 if pretty else None,
+                          separators=None if pretty else (",", ":")).encode()
+    option = _ORJSON_OPTS | orjson.OPT_INDENT_2 if pretty else _ORJSON_OPTS
+    return orjson.dumps(payload, option=option)
+
+
+def deserialize_payload(data: bytes) -> dict:
+    """Decode JSON bytes written by `serialize_payload` (tensors come back as lists)."""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def save_payload(payload: dict, path: str = "output/telemetry_payload.json"):
+    """
+    Write the human-readable (indented) payload JSON in a single write.
+
+    The payload is serialized to one bytes object first; a write larger
+    than the file buffer goes straight to the OS as one syscall.
+    """
+    data = serialize_payload(payload, pretty=True)
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+_TENSOR_FIELDS = ("minkowski_eta", "delta_g_perturb", "g_perturbed")
+
+
+def load_payload(path: str = "output/telemetry_payload.json") -> dict:
+    """
+    Load a payload written by `save_payload` (one read, one parse).
+
+    The physics tensors are restored to float64 ndarrays, so the payload looks
+    exactly like the output of `build_telemetry_payload`, and re-serializing it
+    takes orjson's NumPy buffer path instead of walking nested lists of floats.
+    """
+    with open(path, "rb") as f:
+        payload = deserialize_payload(f.read())
+    physics = payload.get("physics", {})
+    for field in _TENSOR_FIELDS:
+        if field in physics:
+            physics[field] = np.asarray(physics[field], dtype=np.float64)
+    return payload
+
+
+def _json_default(obj):
+    """stdlib json hook for the ndarray / NumPy scalar values orjson handles natively."""
+    if isinstance(obj, (np.ndarray, np.generic)):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 def display_payload_summary(payload: dict):
     """Print a formatted summary of the telemetry payload."""
     console.print(Panel(
@@ -183,7 +377,7 @@ def display_payload_summary(payload: dict):
     for label in labels:
         table.add_column(label, style="yellow")
 
-    delta = np.array(payload["physics"]["delta_g_perturb"])
+    delta = np.asarray(payload["physics"]["delta_g_perturb"])
     for i, row_label in enumerate(labels):
         table.add_row(row_label, *[f"{delta[i,j]:.6e}" for j in range(4)])
 
@@ -197,7 +391,7 @@ def display_payload_summary(payload: dict):
         f"([red]↓{REDUCTION_EPS*100:.1f}%[/red])\n"
     )
     console.print(
-        f"[dim]SHA-3-256 Integrity Hash: {payload['integrity_hash_sha3_256']}[/dim]\n"
+        f"[dim]SHA-256 Integrity Hash: {payload['integrity_hash_sha256']}[/dim]\n"
     )
 
     console.print(Panel(
@@ -209,7 +403,7 @@ def display_payload_summary(payload: dict):
         "  • Medical imaging data in healthcare telemetry\n"
         "  • Financial transactions between clearing houses\n\n"
         "The CLASSIFICATION header mirrors real Data Loss Prevention (DLP) policies.\n"
-        "The SHA-3 hash ensures payload INTEGRITY — any bit-flip during transit\n"
+        "The SHA-256 hash ensures payload INTEGRITY — any bit-flip during transit\n"
         "is detectable. This is the 'I' in the CIA Triad.",
         border_style="yellow"
     ))
@@ -222,8 +416,7 @@ if __name__ == "__main__":
 
     import os
     os.makedirs("output", exist_ok=True)
-    with open("output/telemetry_payload.json", "w") as f:
-        json.dump(payload, f, indent=2)
+    save_payload(payload)
 
     console.print("[bold green]✓ Telemetry payload saved to output/telemetry_payload.json[/bold green]")
     console.print("[dim]Ready for Phase 3: Secure Tunnel Establishment[/dim]\n")
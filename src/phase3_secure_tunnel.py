@@ -34,24 +34,129 @@ DAILY RELEVANCE:
 """
 
 import os
-import json
+import hmac
+import time
+import logging
 import hashlib
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from cryptography.exceptions import InvalidTag
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from cryptography.hazmat.primitives import hashes
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
-import oqs
+import msgpack
+import oqs  # liboqs-python bindings
+
+try:
+    from Crypto.Cipher import AES as _PyCryptodomeAES
+except ImportError:  # PyCryptodome is optional (`uv sync --extra pycryptodome`)
+    _PyCryptodomeAES = None
+
+import verbosity
+from phase1_key_generation import get_kem, load_key_data, encap_secret_into, decap_secret_into
+from phase2_telemetry_payload import serialize_payload, load_payload
 
 console = Console()
+log = logging.getLogger(__name__)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# AES-GCM BACKEND SELECTION
+# ─────────────────────────────────────────────────────────────────────────────
+
+class _PyCryptodomeAESGCM:
+    """
+    PyCryptodome AES-GCM behind the `cryptography` AESGCM interface:
+    `encrypt` returns ciphertext ‖ 16-byte tag, and `decrypt` raises
+    `cryptography.exceptions.InvalidTag` on authentication failure.
+    """
+
+    def __init__(self, key: bytes):
+        self._key = key
+
+    def encrypt(self, nonce: bytes, data: bytes, associated_data: bytes) -> bytes:
+        cipher = _PyCryptodomeAES.new(self._key, _PyCryptodomeAES.MODE_GCM, nonce=nonce)
+        cipher.update(associated_data)
+        ciphertext, tag = cipher.encrypt_and_digest(data)
+        return ciphertext + tag
+
+    def decrypt(self, nonce: bytes, data: bytes, associated_data: bytes) -> bytes:
+        cipher = _PyCryptodomeAES.new(self._key, _PyCryptodomeAES.MODE_GCM, nonce=nonce)
+        cipher.update(associated_data)
+        try:
+            return cipher.decrypt_and_verify(data[:-16], data[-16:])
+        except ValueError:
+            raise InvalidTag() from None
+
+
+@functools.lru_cache(maxsize=None)
+def _AESGCM_IMPL():
+    """
+    Resolve the AES-GCM backend, once per process.
+
+    `cryptography` (OpenSSL, AES-NI + PCLMULQDQ) is the default: it is always
+    installed and measured faster for the lab's ~1 KB payloads. Set
+    ICARUS_AESGCM_IMPL=pycryptodome to use PyCryptodome instead; it is only
+    accepted if it produces the same ciphertext ‖ tag as `cryptography`.
+    """
+    forced = os.environ.get("ICARUS_AESGCM_IMPL", "").strip().lower()
+    if forced != "pycryptodome":
+        return AESGCM
+    if _PyCryptodomeAES is None:
+        log.warning("ICARUS_AESGCM_IMPL=pycryptodome but PyCryptodome is not installed")
+        return AESGCM
+
+    # Both must be standard-conformant AES-GCM: identical ciphertext ‖ tag
+    key, nonce, data, aad = os.urandom(32), os.urandom(12), os.urandom(64), b"icarus"
+    if AESGCM(key).encrypt(nonce, data, aad) != _PyCryptodomeAESGCM(key).encrypt(nonce, data, aad):
+        log.warning("PyCryptodome AES-GCM output differs from cryptography — not using it")
+        return AESGCM
+    return _PyCryptodomeAESGCM
+
+
+@dataclass
+class AesGcmSession:
+    """
+    AES-256-GCM state for one tunnel session.
+
+    Holds a single AES-GCM cipher object from the configured backend
+    (see `_AESGCM_IMPL`) so the AES key schedule is computed once per session
+    rather than once per message, and issues nonces with the
+    NIST SP 800-38D deterministic construction:
+
+        nonce (96 bits) = fixed field (32 bits, random per session)
+                          ‖ invocation counter (64 bits, big-endian)
+
+    A counter cannot repeat under the same key, unlike random nonces whose
+    collision probability grows with the number of messages.
+    """
+
+    aes_key: bytes = field(repr=False)
+    nonce_prefix: bytes = field(default_factory=lambda: os.urandom(4))
+    counter: int = 0
+    aesgcm: AESGCM = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.aesgcm = _AESGCM_IMPL()(self.aes_key)
+
+    def next_nonce(self) -> bytes:
+        """Return the next unique 96-bit nonce for this session's key."""
+        if self.counter >= 2**64:
+            raise OverflowError("GCM invocation counter exhausted — re-key the session")
+        nonce = self.nonce_prefix + self.counter.to_bytes(8, "big")
+        self.counter += 1
+        return nonce
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # SENDER SIDE (Negative-Mass Generator Station)
 # ─────────────────────────────────────────────────────────────────────────────
 
-def sender_encapsulate(public_key_hex: str, algorithm: str = "ML-KEM-768") -> tuple:
+def sender_encapsulate(public_key: bytes, algorithm: str = "ML-KEM-768") -> tuple:
     """
     Generator station encapsulates a shared secret using the observation post's
     public key. This produces:
@@ -59,41 +164,49 @@ def sender_encapsulate(public_key_hex: str, algorithm: str = "ML-KEM-768") -> tu
       - shared_secret:  kept locally; used to derive the AES session key
 
     Args:
-        public_key_hex: Observation post's public key (hex string).
-        algorithm:      ML-KEM variant.
+        public_key: Observation post's public key.
+        algorithm:  ML-KEM variant.
 
     Returns:
-        (ciphertext_kem_hex, shared_secret_bytes)
+        (ciphertext_kem, shared_secret) as freshly allocated bytearrays.
     """
-    public_key_bytes = bytes.fromhex(public_key_hex)
-
-    console.print("\n[bold cyan]SENDER:[/bold cyan] Encapsulating shared secret with receiver's ML-KEM public key...")
-
-    with oqs.KeyEncapsulation(algorithm) as kem:
-        ciphertext_kem, shared_secret = kem.encap_secret(public_key_bytes)
-
-    console.print(f"  [green]✓[/green] KEM Ciphertext generated ({len(ciphertext_kem)} bytes) — safe to transmit")
-    console.print(f"  [green]✓[/green] Local Shared Secret derived ({len(shared_secret)} bytes) — NEVER transmitted")
-    return ciphertext_kem.hex(), shared_secret
-
-
-def derive_aes_key(shared_secret: bytes, context: bytes = b"icarus-tunnel-v1") -> bytes:
+    kem = get_kem(algorithm)
+    ciphertext_kem = bytearray(kem.details["length_ciphertext"])
+    shared_secret  = bytearray(kem.details["length_shared_secret"])
+    encap_secret_into(kem, public_key, ciphertext_kem, shared_secret)
+    log.debug("Encapsulated %s: ciphertext %d bytes, shared secret %d bytes",
+              algorithm, len(ciphertext_kem), len(shared_secret))
+
+    if verbosity.VERBOSE:
+        # One print per step: a single render pass and stdout write, not one per line
+        console.print(
+            "\n[bold cyan]SENDER:[/bold cyan] Encapsulating shared secret with receiver's ML-KEM public key...",
+            f"  [green]✓[/green] KEM Ciphertext generated ({len(ciphertext_kem)} bytes) — safe to transmit",
+            f"  [green]✓[/green] Local Shared Secret derived ({len(shared_secret)} bytes) — NEVER transmitted",
+            sep="\n",
+        )
+    return ciphertext_kem, shared_secret
+
+
+def derive_aes_key(shared_secret: bytes, context: bytes = b"icarus-tunnel-v2-sha256") -> bytes:
     """
-    Derive a 256-bit AES key from the ML-KEM shared secret using HKDF-SHA3-256.
+    Derive a 256-bit AES key from the ML-KEM shared secret using HKDF-SHA256.
 
     HKDF (HMAC-based Key Derivation Function) is used because raw ML-KEM output
     may not be uniformly distributed. HKDF extracts and expands it into a
-    cryptographically secure key of the desired length.
+    cryptographically secure key of the desired length. SHA-256 runs on the
+    CPU's SHA-NI / ARMv8 SHA2 instructions via OpenSSL, unlike SHA-3.
 
     Args:
         shared_secret: Raw bytes from ML-KEM encapsulation.
         context:       Domain separator — prevents key reuse across protocols.
+                       Versioned so v1 (HKDF-SHA3-256) keys never collide with v2.
 
     Returns:
         32-byte AES-256 key.
     """
     hkdf = HKDF(
-        algorithm=hashes.SHA3_256(),
+        algorithm=hashes.SHA256(),
         length=32,
         salt=None,
         info=context,
@@ -101,7 +214,30 @@ def derive_aes_key(shared_secret: bytes, context: bytes = b"icarus-tunnel-v1") -
     return hkdf.derive(shared_secret)
 
 
-def encrypt_payload(aes_key: bytes, plaintext: bytes) -> tuple:
+def agreed_aes_key(shared_secret_sender: bytes, shared_secret_receiver: bytes) -> bytes:
+    """
+    Check that both ends decapsulated the same secret, then derive the AES key once.
+
+    KEM correctness means sender and receiver hold identical secrets, so running
+    HKDF on each side inside one process only repeats the same work. Used by the
+    in-process orchestrators, where both ends live in the same interpreter.
+
+    Args:
+        shared_secret_sender:   Secret returned by `sender_encapsulate`.
+        shared_secret_receiver: Secret returned by `receiver_decapsulate`.
+
+    Returns:
+        32-byte AES-256 key shared by both ends.
+
+    Raises:
+        RuntimeError: If the two secrets differ (constant-time comparison).
+    """
+    if not hmac.compare_digest(shared_secret_sender, shared_secret_receiver):
+        raise RuntimeError("SHARED SECRET MISMATCH! Sender and receiver disagree after decapsulation")
+    return derive_aes_key(shared_secret_sender)
+
+
+def encrypt_payload(session: AesGcmSession, plaintext: bytes) -> tuple:
     """
     Encrypt the telemetry payload using AES-256-GCM (Authenticated Encryption).
 
@@ -110,56 +246,65 @@ def encrypt_payload(aes_key: bytes, plaintext: bytes) -> tuple:
       - INTEGRITY/AUTHENTICATION: any tampering is detected via the auth tag
 
     Args:
-        aes_key:    32-byte AES-256 key.
+        session:    Sender's AES-GCM session (cached cipher + nonce counter).
         plaintext:  Raw bytes of the serialized telemetry payload.
 
     Returns:
-        (nonce_hex, ciphertext_hex, aad)
+        (nonce_bytes, ciphertext_bytes, aad_bytes)
     """
-    nonce = os.urandom(12)  # 96-bit nonce — MUST be unique per encryption
+    nonce = session.next_nonce()  # 96-bit nonce — MUST be unique per encryption
     aad   = b"icarus-telemetry-channel"  # Additional Authenticated Data
 
-    aesgcm    = AESGCM(aes_key)
-    ciphertext = aesgcm.encrypt(nonce, plaintext, aad)
+    ciphertext = session.aesgcm.encrypt(nonce, plaintext, aad)
+    log.debug("Encrypted %d-byte payload with AES-256-GCM (%d bytes incl. tag)",
+              len(plaintext), len(ciphertext))
 
-    console.print(f"\n[bold cyan]SENDER:[/bold cyan] Encrypting telemetry payload with AES-256-GCM...")
-    console.print(f"  [green]✓[/green] Nonce (random, unique): {nonce.hex()}")
-    console.print(f"  [green]✓[/green] AAD: '{aad.decode()}' (authenticated but NOT encrypted)")
-    console.print(f"  [green]✓[/green] Ciphertext: {len(ciphertext)} bytes (payload + 16-byte GCM auth tag)")
+    if verbosity.VERBOSE:
+        console.print(
+            "\n[bold cyan]SENDER:[/bold cyan] Encrypting telemetry payload with AES-256-GCM...",
+            f"  [green]✓[/green] Nonce (counter, unique): {nonce.hex()}",
+            f"  [green]✓[/green] AAD: '{aad.decode()}' (authenticated but NOT encrypted)",
+            f"  [green]✓[/green] Ciphertext: {len(ciphertext)} bytes (payload + 16-byte GCM auth tag)",
+            sep="\n",
+        )
 
-    return nonce.hex(), ciphertext.hex(), aad.decode()
+    return nonce, ciphertext, aad
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # RECEIVER SIDE (Remote Observation Post)
 # ─────────────────────────────────────────────────────────────────────────────
 
-def receiver_decapsulate(private_key_hex: str, ciphertext_kem_hex: str,
+def receiver_decapsulate(private_key: bytes, ciphertext_kem: bytes,
                           algorithm: str = "ML-KEM-768") -> bytes:
     """
     Observation post decapsulates the shared secret using its private key.
 
     Args:
-        private_key_hex:    The receiver's secret key (hex string).
-        ciphertext_kem_hex: The KEM ciphertext received from sender.
-        algorithm:          ML-KEM variant.
+        private_key:    The receiver's secret key.
+        ciphertext_kem: The KEM ciphertext received from sender.
+        algorithm:      ML-KEM variant.
 
     Returns:
-        shared_secret_bytes — must match sender's shared secret exactly.
+        shared_secret (bytearray) — must match sender's shared secret exactly.
     """
-    private_key_bytes  = bytes.fromhex(private_key_hex)
-    ciphertext_kem_bytes = bytes.fromhex(ciphertext_kem_hex)
-
-    console.print("\n[bold magenta]RECEIVER:[/bold magenta] Decapsulating shared secret with private key...")
-
-    with oqs.KeyEncapsulation(algorithm, secret_key=private_key_bytes) as kem:
-        shared_secret = kem.decap_secret(ciphertext_kem_bytes)
-
-    console.print(f"  [green]✓[/green] Shared Secret recovered ({len(shared_secret)} bytes)")
+    # Secret-key-bound context: not cached, cleansed and freed on leaving `with`
+    with oqs.KeyEncapsulation(algorithm, secret_key=private_key) as kem:
+        shared_secret = bytearray(kem.details["length_shared_secret"])
+        decap_secret_into(kem, ciphertext_kem, shared_secret)
+    log.debug("Decapsulated %s: shared secret %d bytes", algorithm, len(shared_secret))
+
+    if verbosity.VERBOSE:
+        console.print(
+            "\n[bold magenta]RECEIVER:[/bold magenta] Decapsulating shared secret with private key...",
+            f"  [green]✓[/green] Shared Secret recovered ({len(shared_secret)} bytes)",
+            sep="\n",
+        )
     return shared_secret
 
 
-def decrypt_payload(aes_key: bytes, nonce_hex: str, ciphertext_hex: str, aad: str) -> bytes:
+def decrypt_payload(session: AesGcmSession, nonce: bytes, ciphertext: bytes,
+                    aad: bytes) -> bytes:
     """
     Decrypt and authenticate the telemetry payload.
 
@@ -167,42 +312,97 @@ def decrypt_payload(aes_key: bytes, nonce_hex: str, ciphertext_hex: str, aad: st
     cryptography.exceptions.InvalidTag — this is how we detect the MITM attack.
 
     Args:
-        aes_key:        32-byte AES-256 key derived from shared secret.
-        nonce_hex:      Nonce used during encryption.
-        ciphertext_hex: Encrypted payload.
-        aad:            Additional authenticated data.
+        session:    Receiver's AES-GCM session, keyed from the shared secret.
+        nonce:      Nonce used during encryption.
+        ciphertext: Encrypted payload (including the 16-byte GCM tag).
+        aad:        Additional authenticated data.
 
     Returns:
         Decrypted plaintext bytes.
     """
-    from cryptography.exceptions import InvalidTag
-
-    nonce      = bytes.fromhex(nonce_hex)
-    ciphertext = bytes.fromhex(ciphertext_hex)
-    aesgcm     = AESGCM(aes_key)
-
-    console.print("\n[bold magenta]RECEIVER:[/bold magenta] Decrypting and authenticating payload...")
+    if verbosity.VERBOSE:
+        console.print("\n[bold magenta]RECEIVER:[/bold magenta] Decrypting and authenticating payload...")
 
     try:
-        plaintext = aesgcm.decrypt(nonce, ciphertext, aad.encode())
-        console.print("  [green]✓[/green] GCM Authentication Tag VALID — payload integrity confirmed")
-        console.print("  [green]✓[/green] Decryption successful")
-        return plaintext
+        plaintext = session.aesgcm.decrypt(nonce, ciphertext, aad)
     except InvalidTag:
-        console.print("  [red]✗ AUTHENTICATION FAILED — payload has been TAMPERED[/red]")
-        console.print("  [red]  → DISCARDING payload. Possible Man-in-the-Middle attack![/red]")
+        log.warning("GCM authentication failed — discarding %d-byte ciphertext", len(ciphertext))
+        if verbosity.VERBOSE:
+            console.print(
+                "  [red]✗ AUTHENTICATION FAILED — payload has been TAMPERED[/red]",
+                "  [red]  → DISCARDING payload. Possible Man-in-the-Middle attack![/red]",
+                sep="\n",
+            )
         raise
 
+    log.debug("Decrypted and authenticated %d-byte payload", len(plaintext))
+    if verbosity.VERBOSE:
+        console.print(
+            "  [green]✓[/green] GCM Authentication Tag VALID — payload integrity confirmed",
+            "  [green]✓[/green] Decryption successful",
+            sep="\n",
+        )
+    return plaintext
+
+
+def _sender_session(public_key: bytes, plaintext: bytes, algorithm: str) -> tuple:
+    """One complete sender-side session: encapsulate → derive → encrypt."""
+    ciphertext_kem, shared_secret = sender_encapsulate(public_key, algorithm)
+    nonce, ciphertext, aad = encrypt_payload(AesGcmSession(derive_aes_key(shared_secret)),
+                                             plaintext)
+    return ciphertext_kem, nonce, ciphertext, aad
+
+
+def run_sessions(public_key: bytes, plaintext: bytes, n_sessions: int, workers: int,
+                 algorithm: str = "ML-KEM-768") -> dict:
+    """
+    Establish `n_sessions` independent sender-side tunnel sessions in parallel.
+
+    liboqs and OpenSSL release the GIL inside their C code, so a thread pool
+    scales the encapsulate/derive/encrypt pipeline with core count until Python
+    dispatch dominates. Each worker thread uses its own cached encapsulation
+    context (see `get_kem`), freed when the pool's threads exit. Per-session
+    console output is suppressed while running.
+
+    Args:
+        public_key: Receiver's ML-KEM public key.
+        plaintext:  Payload encrypted once per session.
+        n_sessions: Number of sessions to establish.
+        workers:    Thread pool size.
+        algorithm:  ML-KEM variant.
+
+    Returns:
+        Dict with the per-session (ciphertext_kem, nonce, ciphertext, aad)
+        tuples, total elapsed nanoseconds, and sessions per second.
+    """
+    was_verbose = verbosity.VERBOSE
+    verbosity.set_verbose(False)
+    try:
+        start = time.perf_counter_ns()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_sender_session, public_key, plaintext, algorithm)
+                       for _ in range(n_sessions)]
+            sessions = [future.result() for future in futures]
+        elapsed_ns = time.perf_counter_ns() - start
+    finally:
+        verbosity.set_verbose(was_verbose)
+
+    return {
+        "sessions":         sessions,
+        "elapsed_ns":       elapsed_ns,
+        "sessions_per_sec": n_sessions / (elapsed_ns / 1e9) if elapsed_ns else float("inf"),
+    }
+
 
-def display_tunnel_summary(ciphertext_kem_hex: str, nonce_hex: str,
-                             ciphertext_hex: str, aad: str):
+def display_tunnel_summary(ciphertext_kem: bytes, nonce: bytes,
+                             ciphertext: bytes, aad: bytes):
     """Display what gets transmitted over the (insecure) network vs what stays local."""
     console.print(Panel(
         "[bold]NETWORK TRANSMISSION (visible to adversary):[/bold]\n"
-        f"  KEM Ciphertext:    {ciphertext_kem_hex[:48]}... ({len(ciphertext_kem_hex)//2} bytes)\n"
-        f"  AES Nonce:         {nonce_hex}\n"
-        f"  AES Ciphertext:    [first 48 hex chars shown]...\n"
-        f"  AAD (plaintext):   '{aad}'\n\n"
+        f"  KEM Ciphertext:    {ciphertext_kem[:24].hex()}... ({len(ciphertext_kem)} bytes)\n"
+        f"  AES Nonce:         {nonce.hex()}\n"
+        f"  AES Ciphertext:    {ciphertext[:24].hex()}... ({len(ciphertext)} bytes)\n"
+        f"  AAD (plaintext):   '{aad.decode()}'\n\n"
         "[bold green]WHAT ADVERSARY LEARNS FROM THIS:[/bold green] Nothing useful.\n"
         "The KEM ciphertext is quantum-safe — decoding it requires solving SVP\n"
         "on a 768-dimensional lattice (≈ 2^178 operations on best known algorithms).",
@@ -211,52 +411,96 @@ def display_tunnel_summary(ciphertext_kem_hex: str, nonce_hex: str,
     ))
 
 
+def save_tunnel_record(algorithm: str, ciphertext_kem: bytes, nonce: bytes,
+                       ciphertext: bytes, aad: bytes,
+                       path: str = "output/tunnel_record.msgpack") -> dict:
+    """
+    Persist everything that crossed the network as a msgpack record.
+
+    Binary fields are stored as raw msgpack `bin` values — no hex or base64
+    encoding on write, no decoding on load.
+
+    Returns:
+        The record dict that was written.
+    """
+    tunnel_record = {
+        "algorithm":      algorithm,
+        "kem_ciphertext": ciphertext_kem,
+        "aes_nonce":      nonce,
+        "aes_ciphertext": ciphertext,
+        "aad":            aad,
+    }
+    with open(path, "wb") as f:
+        f.write(msgpack.packb(tunnel_record, use_bin_type=True))
+    return tunnel_record
+
+
+def load_tunnel_record(path: str = "output/tunnel_record.msgpack") -> dict:
+    """Load a tunnel record written by `save_tunnel_record`."""
+    with open(path, "rb") as f:
+        return msgpack.unpackb(f.read(), raw=False)
+
+
 if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Project Icarus — Phase 3: Secure Tunnel")
+    parser.add_argument("--sessions", type=int, metavar="N",
+                        help="Also benchmark N parallel sender sessions after the demo")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Thread pool size for --sessions (default: CPU count)")
+    args = parser.parse_args()
+
     console.print("\n[bold white on blue]  PROJECT ICARUS — PHASE 3  [/bold white on blue]\n")
 
     # Load key material from Phase 1
-    with open("output/keys.json") as f:
-        key_data = json.load(f)
+    keyring = load_key_data()
 
     # Load telemetry payload from Phase 2
-    with open("output/telemetry_payload.json") as f:
-        payload = json.load(f)
+    payload = load_payload()
 
-    plaintext = json.dumps(payload).encode()
+    plaintext = serialize_payload(payload)
 
     # ── SENDER ──────────────────────────────────────────────────────────────
-    ciphertext_kem_hex, shared_secret_sender = sender_encapsulate(
-        key_data["public_key"], key_data["algorithm"]
+    ciphertext_kem, shared_secret_sender = sender_encapsulate(
+        keyring.public_key, keyring.algorithm
     )
     aes_key_sender = derive_aes_key(shared_secret_sender)
-    nonce_hex, ciphertext_hex, aad = encrypt_payload(aes_key_sender, plaintext)
+    nonce, ciphertext, aad = encrypt_payload(AesGcmSession(aes_key_sender), plaintext)
 
-    display_tunnel_summary(ciphertext_kem_hex, nonce_hex, ciphertext_hex, aad)
+    display_tunnel_summary(ciphertext_kem, nonce, ciphertext, aad)
 
     # ── RECEIVER ─────────────────────────────────────────────────────────────
     shared_secret_receiver = receiver_decapsulate(
-        key_data["private_key"], ciphertext_kem_hex, key_data["algorithm"]
+        keyring.private_key, ciphertext_kem, keyring.algorithm
     )
     aes_key_receiver = derive_aes_key(shared_secret_receiver)
-    plaintext_recovered = decrypt_payload(aes_key_receiver, nonce_hex, ciphertext_hex, aad)
+    plaintext_recovered = decrypt_payload(AesGcmSession(aes_key_receiver),
+                                          nonce, ciphertext, aad)
 
     # Verify secrets match
     assert shared_secret_sender == shared_secret_receiver, "SHARED SECRET MISMATCH!"
-    assert json.loads(plaintext_recovered) == payload, "PAYLOAD MISMATCH!"
+    assert plaintext_recovered == plaintext, "PAYLOAD MISMATCH!"
 
-    console.print("\n[bold green]✓ SECURE TUNNEL ESTABLISHED AND VERIFIED[/bold green]")
-    console.print("[bold green]✓ telemetry delivered with CONFIDENTIALITY + INTEGRITY[/bold green]")
+    console.print("\n[bold green]✓ SECURE TUNNEL ESTABLISHED AND VERIFIED[/bold green]",
+                  "[bold green]✓ telemetry delivered with CONFIDENTIALITY + INTEGRITY[/bold green]",
+                  sep="\n")
 
     # Save tunnel artifacts
-    tunnel_record = {
-        "algorithm":         key_data["algorithm"],
-        "kem_ciphertext":    ciphertext_kem_hex,
-        "aes_nonce":         nonce_hex,
-        "aes_ciphertext":    ciphertext_hex,
-        "aad":               aad,
-    }
-    with open("output/tunnel_record.json", "w") as f:
-        json.dump(tunnel_record, f, indent=2)
+    save_tunnel_record(keyring.algorithm, ciphertext_kem, nonce, ciphertext, aad)
+
+    console.print("[bold green]✓ Tunnel record saved to output/tunnel_record.msgpack[/bold green]")
+
+    if args.sessions:
+        result = run_sessions(keyring.public_key, plaintext, args.sessions, args.workers,
+                              keyring.algorithm)
+        table = Table(title="Parallel Session Setup", border_style="cyan")
+        table.add_column("Property", style="bold white")
+        table.add_column("Value", style="yellow")
+        table.add_row("Sessions", str(args.sessions))
+        table.add_row("Workers", str(args.workers))
+        table.add_row("Elapsed", f"{result['elapsed_ns'] / 1e6:.2f} ms")
+        table.add_row("Throughput", f"{result['sessions_per_sec']:.0f} sessions/s")
+        console.print(table)
 
-    console.print("[bold green]✓ Tunnel record saved to output/tunnel_record.json[/bold green]")
     console.print("[dim]Ready for Phase 4: Quantum Man-in-the-Middle Attack Simulation[/dim]\n")
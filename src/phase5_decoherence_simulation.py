@@ -36,7 +36,7 @@ DAILY RELEVANCE:
 """
 
 import time
-import random
+import functools
 import numpy as np
 from rich.console import Console
 from rich.panel import Panel
@@ -44,8 +44,72 @@ from rich.table import Table
 from rich.live import Live
 from rich.text import Text
 
+import verbosity
+
 console = Console()
 
+# Every possible coherence bar (0..40 cells filled) per color, built once
+_BAR_WIDTH = 40
+_BARS = {
+    color: [f"[{color}]{'█' * i}{'░' * (_BAR_WIDTH - i)}[/{color}]" for i in range(_BAR_WIDTH + 1)]
+    for color in ("green", "yellow", "red")
+}
+_BAR_TEXT = {color: [Text.from_markup(bar) for bar in bars] for color, bars in _BARS.items()}
+# Markup-free bars for redirected output (CI logs, `tee`), where styling is discarded
+_PLAIN_BARS = [f"{'#' * i}{'.' * (_BAR_WIDTH - i)}" for i in range(_BAR_WIDTH + 1)]
+
+# Ensemble size (replicates × ticks) from which `run_many` uses the Numba kernels
+# by default; below it the numba import + first compile (~0.4 s) never pays off
+_JIT_MIN_CELLS = 1 << 20
+
+
+def _clamped_decay_scan(out: np.ndarray, initial: float, keep: float, noise: np.ndarray):
+    """
+    Exact per-tick recurrence c_k = clip(c_{k-1}·keep + noise_k, 0, 1), in place.
+
+    The clamp makes the recurrence non-linear, so it cannot be collapsed into
+    a cumprod/cumsum closed form without changing the trajectory whenever the
+    field saturates at 1 or collapses to 0.
+    """
+    c = initial
+    for i in range(out.shape[0]):
+        c = c * keep + noise[i]
+        if c < 0.0:
+            c = 0.0
+        elif c > 1.0:
+            c = 1.0
+        out[i] = c
+
+
+def _clamped_decay_scan_many(out: np.ndarray, initial: float, keep: float, noise: np.ndarray):
+    """`_clamped_decay_scan` for every row of `out` (one replicate per row)."""
+    c = np.full(out.shape[0], initial)
+    for i in range(out.shape[1]):
+        c = np.clip(c * keep + noise[:, i], 0.0, 1.0)
+        out[:, i] = c
+
+
+@functools.lru_cache(maxsize=None)
+def _jit_kernels():
+    """
+    Numba-compiled (scan, scan_many) kernels, or None without numba.
+
+    numba is optional (`uv sync --extra jit`) and imported here, on the first
+    call that opts in, so the lab's single 25-tick timeline never pays for it.
+    """
+    try:
+        from numba import njit, prange
+    except ImportError:
+        return None
+    scan = njit(cache=True)(_clamped_decay_scan)
+
+    @njit(cache=True, parallel=True)
+    def scan_many(out, initial, keep, noise):
+        for r in prange(out.shape[0]):
+            scan(out[r], initial, keep, noise[r])
+
+    return scan, scan_many
+
 
 class GravityFieldDecoherenceSimulator:
     """
@@ -53,17 +117,37 @@ class GravityFieldDecoherenceSimulator:
     Maps directly to quantum computing decoherence timescales.
     """
 
-    def __init__(self, initial_coherence: float = 1.0, decay_rate: float = 0.05):
+    def __init__(self, initial_coherence: float = 1.0, decay_rate: float = 0.05,
+                 max_ticks: int = 64, seed: int = None):
         """
         Args:
             initial_coherence: Normalized coherence [0,1]. 1.0 = fully coherent.
             decay_rate:        Per-tick exponential decay constant.
+            max_ticks:         Initial history capacity; doubled whenever exceeded.
+            seed:              Optional seed for the noise generator (reproducible runs).
         """
         self.coherence = initial_coherence
         self.decay_rate = decay_rate
-        self.history   = []
+        self._rng      = np.random.default_rng(seed)
+        self._history  = np.empty(max(1, max_ticks), dtype=np.float32)
         self.tick      = 0
 
+    @property
+    def history(self) -> np.ndarray:
+        """Coherence after each tick so far (a view, no copy)."""
+        return self._history[:self.tick]
+
+    def _reserve(self, n_ticks: int):
+        """Grow the history buffer (by doubling) to hold `n_ticks` more ticks."""
+        needed = self.tick + n_ticks
+        if needed > self._history.shape[0]:
+            capacity = self._history.shape[0]
+            while capacity < needed:
+                capacity *= 2
+            grown = np.empty(capacity, dtype=np.float32)
+            grown[:self.tick] = self._history[:self.tick]
+            self._history = grown
+
     def step(self, perturbation_noise: float = 0.0) -> float:
         """
         Advance one time step with optional external noise perturbation.
@@ -74,18 +158,75 @@ class GravityFieldDecoherenceSimulator:
         # Exponential decay (T2 dephasing analog)
         self.coherence *= (1 - self.decay_rate)
         # Add stochastic noise (thermal fluctuation / environmental coupling)
-        noise = random.gauss(0, perturbation_noise)
+        noise = self._rng.normal(0.0, perturbation_noise)
         self.coherence = max(0.0, min(1.0, self.coherence + noise))
+        self._reserve(1)
+        self._history[self.tick] = self.coherence
         self.tick += 1
-        self.history.append(round(self.coherence, 4))
         return self.coherence
 
+    def run_batch(self, n_steps: int, noise_std: float = 0.0, jit: bool = False) -> np.ndarray:
+        """
+        Advance `n_steps` ticks at once; equivalent to calling `step()` in a loop.
+
+        All Gaussian noise samples are drawn in one vectorized call and the
+        clamped decay recurrence fills a preallocated array, so the per-tick
+        generator call overhead is paid once.
+
+        Args:
+            n_steps:   Number of ticks to simulate.
+            noise_std: Standard deviation of the per-tick environmental noise.
+            jit:       Run the recurrence with the Numba kernel (long runs only;
+                       falls back to Python when numba is not installed).
+
+        Returns:
+            float64 array of the coherence after each tick.
+        """
+        noise = self._rng.normal(0.0, noise_std, n_steps)
+        trajectory = np.empty(n_steps)
+        kernels = _jit_kernels() if jit else None
+        scan = kernels[0] if kernels is not None else _clamped_decay_scan
+        scan(trajectory, self.coherence, 1.0 - self.decay_rate, noise)
+
+        if n_steps:
+            self.coherence = float(trajectory[-1])
+        self._reserve(n_steps)
+        self._history[self.tick:self.tick + n_steps] = trajectory
+        self.tick += n_steps
+        return trajectory
+
+    def run_many(self, n_replicates: int, n_steps: int, noise_std: float = 0.0,
+                 jit: bool = None) -> np.ndarray:
+        """
+        Simulate an ensemble of independent timelines from the current state.
+
+        The recurrence is vectorized across replicates with NumPy; large
+        ensembles instead run replicates across all cores with Numba, when it
+        is installed. The simulator's own state is left untouched.
+
+        Args:
+            n_replicates: Number of independent timelines.
+            n_steps:      Ticks per timeline.
+            noise_std:    Standard deviation of the per-tick environmental noise.
+            jit:          Force (True) or skip (False) the Numba kernel. Defaults
+                          to using it from `_JIT_MIN_CELLS` replicate-ticks up.
+
+        Returns:
+            float64 array of shape (n_replicates, n_steps).
+        """
+        if jit is None:
+            jit = n_replicates * n_steps >= _JIT_MIN_CELLS
+        noise = self._rng.normal(0.0, noise_std, (n_replicates, n_steps))
+        ensemble = np.empty((n_replicates, n_steps))
+        kernels = _jit_kernels() if jit else None
+        scan_many = kernels[1] if kernels is not None else _clamped_decay_scan_many
+        scan_many(ensemble, self.coherence, 1.0 - self.decay_rate, noise)
+        return ensemble
+
     def coherence_bar(self) -> str:
         """Return a visual coherence bar."""
-        filled = int(self.coherence * 40)
-        color  = "green" if self.coherence > 0.6 else ("yellow" if self.coherence > 0.3 else "red")
-        bar    = f"[{color}]{'█' * filled}{'░' * (40 - filled)}[/{color}]"
-        return bar
+        color = "green" if self.coherence > 0.6 else ("yellow" if self.coherence > 0.3 else "red")
+        return _BARS[color][int(self.coherence * _BAR_WIDTH)]
 
     def is_coherent(self, threshold: float = 0.25) -> bool:
         """Is the field/system still coherently operational?"""
@@ -105,26 +246,37 @@ class CryptographicAgility:
         {"name": "X25519+AES256", "pqc": False, "nist_level": None, "status": "EMERGENCY (classical)"},
     ]
 
+    # Coherence breakpoints (ascending) and the chain index chosen in each band:
+    #   (·, 0.2] → 3   (0.2, 0.4] → 2   (0.4, 0.7] → 1   (0.7, ·) → 0
+    _THRESHOLDS = np.array([0.2, 0.4, 0.7])
+    _ALGO_IDX   = np.array([3, 2, 1, 0])
+
+    def negotiate_indices(self, field_coherence) -> np.ndarray:
+        """ALGORITHM_CHAIN index for each coherence value, classified in one pass."""
+        return self._ALGO_IDX[np.searchsorted(self._THRESHOLDS, field_coherence, side="left")]
+
     def negotiate_algorithm(self, field_coherence: float) -> dict:
         """
         Select the best available algorithm based on system stability.
         When the field is degenerating, fall back to simpler/more stable options.
         """
-        if field_coherence > 0.7:
-            return self.ALGORITHM_CHAIN[0]
-        elif field_coherence > 0.4:
-            return self.ALGORITHM_CHAIN[1]
-        elif field_coherence > 0.2:
-            return self.ALGORITHM_CHAIN[2]
-        else:
-            return self.ALGORITHM_CHAIN[3]
+        return self.ALGORITHM_CHAIN[self.negotiate_indices(field_coherence)]
 
 
-def run_decoherence_timeline(steps: int = 30, noise_std: float = 0.02):
+def run_decoherence_timeline(steps: int = 30, noise_std: float = 0.02, styled: bool = None):
     """
     Run the full decoherence simulation timeline with live terminal visualization.
+
+    Args:
+        steps:     Number of simulation ticks.
+        noise_std: Standard deviation of the per-tick stochastic noise.
+        styled:    Render the colored █/░ timeline. Defaults to whether the
+                   console is a terminal; pass True when the console captures
+                   output for later replay to one (rows are then printed one
+                   by one, since a Live region cannot be replayed).
     """
-    field = GravityFieldDecoherenceSimulator(initial_coherence=1.0, decay_rate=0.06)
+    field = GravityFieldDecoherenceSimulator(initial_coherence=1.0, decay_rate=0.06,
+                                             max_ticks=steps)
     agility = CryptographicAgility()
 
     console.print(Panel(
@@ -136,32 +288,75 @@ def run_decoherence_timeline(steps: int = 30, noise_std: float = 0.02):
         border_style="blue"
     ))
 
-    console.print()
-    previous_algo = None
-    for step in range(steps):
-        coherence  = field.step(perturbation_noise=noise_std)
-        algo       = agility.negotiate_algorithm(coherence)
-        bar        = field.coherence_bar()
-        algo_color = "green" if algo["pqc"] else "red"
-
-        console.print(
-            f"  t={step:02d}  {bar}  "
-            f"[bold]{coherence:.3f}[/bold]  "
-            f"[{algo_color}]{algo['name']}[/{algo_color}]"
-            + (" [bold yellow]← ALGORITHM SWITCH[/bold yellow]" if algo["name"] != previous_algo and previous_algo else "")
-        )
-        previous_algo = algo["name"]
-        time.sleep(0.15)
-
-        if coherence < 0.05:
-            console.print("\n  [bold red]⚠ FIELD COLLAPSE — tunnel session terminated[/bold red]")
-            break
-
-    return field.history
+    # Simulate the whole timeline up front; the loop below only renders it
+    trajectory = field.run_batch(steps, noise_std)
+    algo_idx   = agility.negotiate_indices(trajectory).tolist()
+    end        = steps
 
+    console.print()
+    if styled is None:
+        styled = console.is_terminal
+    # One Live region renders the growing table at a fixed refresh rate instead
+    # of a full console.print flush per tick; cells are prebuilt Text objects
+    timeline = Table(box=None, show_header=False, padding=(0, 1))
+    for _ in range(5):
+        timeline.add_column()
+    live = Live(timeline, console=console, refresh_per_second=8) if styled and console.is_terminal else None
+    if live is not None:
+        live.start()
 
-def print_decoherence_cybersecurity_bridge():
-    """Bridge the decoherence concept to everyday cybersecurity."""
+    previous_algo = None
+    try:
+        for step in range(steps):
+            coherence       = float(trajectory[step])
+            field.coherence = coherence
+            algo            = agility.ALGORITHM_CHAIN[algo_idx[step]]
+            switched        = algo["name"] != previous_algo and previous_algo
+            color           = "green" if coherence > 0.6 else ("yellow" if coherence > 0.3 else "red")
+
+            if live is not None:
+                timeline.add_row(
+                    f" t={step:02d}",
+                    _BAR_TEXT[color][int(coherence * _BAR_WIDTH)],
+                    Text(f"{coherence:.3f}", style="bold"),
+                    Text(algo["name"], style="green" if algo["pqc"] else "red"),
+                    Text("← ALGORITHM SWITCH", style="bold yellow") if switched else "",
+                )
+            elif styled:
+                console.print(Text.assemble(
+                    f"  t={step:02d}  ",
+                    _BAR_TEXT[color][int(coherence * _BAR_WIDTH)],
+                    "  ",
+                    (f"{coherence:.3f}", "bold"),
+                    "  ",
+                    (algo["name"], "green" if algo["pqc"] else "red"),
+                    (" ← ALGORITHM SWITCH", "bold yellow") if switched else "",
+                ))
+            else:
+                # Not a TTY: skip Rich's markup parse and segment rendering entirely
+                console.file.write(
+                    f"  t={step:02d}  {_PLAIN_BARS[int(coherence * _BAR_WIDTH)]}  "
+                    f"{coherence:.3f}  {algo['name']}"
+                    + (" <- ALGORITHM SWITCH\n" if switched else "\n")
+                )
+            previous_algo = algo["name"]
+            if not verbosity.FAST:
+                time.sleep(0.15)
+
+            if coherence < 0.05:
+                end = step + 1
+                break
+    finally:
+        if live is not None:
+            live.stop()
+
+    if end < steps:
+        console.print("\n  [bold red]⚠ FIELD COLLAPSE — tunnel session terminated[/bold red]")
+
+    return trajectory[:end]
+
+
+def _build_bridge_table() -> Table:
     table = Table(
         title="Decoherence: Physics ↔ Cybersecurity Parallels",
         border_style="magenta"
@@ -185,7 +380,15 @@ def print_decoherence_cybersecurity_bridge():
     ]
     for row in rows:
         table.add_row(*row)
-    console.print(table)
+    return table
+
+
+_BRIDGE_TABLE = _build_bridge_table()   # static content: build once at import
+
+
+def print_decoherence_cybersecurity_bridge():
+    """Bridge the decoherence concept to everyday cybersecurity."""
+    console.print(_BRIDGE_TABLE)
 
 
 if __name__ == "__main__":
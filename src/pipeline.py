@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+╔══════════════════════════════════════════════════════════════════════════╗
+║    PROJECT ICARUS — IN-MEMORY TELEMETRY PIPELINE                         ║
+║    Key generation → payload → secure tunnel, without disk round-trips    ║
+╚══════════════════════════════════════════════════════════════════════════╝
+
+The standalone phase scripts hand data to each other through output/: Phase 2
+writes telemetry_payload.json, Phase 3 parses it back and re-serializes it for
+encryption. Here the payload stays in memory and is serialized exactly once,
+straight into AES-256-GCM. Artifacts are written only with --persist.
+
+Usage:
+    uv run icarus-pipeline              # in-memory only
+    uv run icarus-pipeline --persist    # also write output/ artifacts
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Same import resolution as run_lab.py: support both the entry point and direct exec
+_SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+if _SRC_DIR not in sys.path:
+    sys.path.insert(0, _SRC_DIR)
+
+_ROOT_DIR = os.path.dirname(_SRC_DIR)
+
+from rich.console import Console
+
+import phase1_key_generation    as p1
+import phase2_telemetry_payload as p2
+import phase3_secure_tunnel     as p3
+
+console = Console()
+
+
+def run_pipeline(security_level: str = "ML-KEM-768", persist: bool = False,
+                 out_dir: str = None) -> dict:
+    """
+    Run Phases 1–3 end to end with the payload kept in memory.
+
+    Args:
+        security_level: ML-KEM parameter set for the receiver's key pair.
+        persist:        Also write keys, payload and tunnel record to `out_dir`.
+        out_dir:        Artifact directory (defaults to <project root>/output).
+
+    Returns:
+        Dict with the transmitted tunnel fields and the pipeline wall time.
+    """
+    start = time.perf_counter_ns()
+
+    keyring   = p1.generate_mlkem_keypair(security_level)
+    payload   = p2.build_telemetry_payload()
+    plaintext = p2.serialize_payload(payload)      # the only serialization
+
+    # ── KEY AGREEMENT ───────────────────────────────────────────────────────
+    kem_ct, ss_sender = p3.sender_encapsulate(keyring.public_key, keyring.algorithm)
+    ss_receiver       = p3.receiver_decapsulate(keyring.private_key, kem_ct, keyring.algorithm)
+    aes_key           = p3.agreed_aes_key(ss_sender, ss_receiver)   # one HKDF for both ends
+
+    # ── SENDER → RECEIVER ───────────────────────────────────────────────────
+    nonce, ct, aad = p3.encrypt_payload(p3.AesGcmSession(aes_key), plaintext)
+    recovered      = p3.decrypt_payload(p3.AesGcmSession(aes_key), nonce, ct, aad)
+
+    assert recovered == plaintext, "PAYLOAD MISMATCH!"
+    elapsed_ns = time.perf_counter_ns() - start
+
+    if persist:
+        out_dir = out_dir or os.path.join(_ROOT_DIR, "output")
+        os.makedirs(out_dir, exist_ok=True)
+        p1.save_key_data(keyring, os.path.join(out_dir, "keys.msgpack"))
+        p2.save_payload(payload, os.path.join(out_dir, "telemetry_payload.json"))
+        p3.save_tunnel_record(security_level, kem_ct, nonce, ct, aad,
+                              os.path.join(out_dir, "tunnel_record.msgpack"))
+
+    return {
+        "algorithm":      security_level,
+        "kem_ciphertext": kem_ct,
+        "aes_nonce":      nonce,
+        "aes_ciphertext": ct,
+        "aad":            aad,
+        "elapsed_ns":     elapsed_ns,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Project Icarus in-memory telemetry pipeline")
+    parser.add_argument("--persist", action="store_true",
+                        help="Write keys, payload and tunnel record to ./output/")
+    args = parser.parse_args()
+
+    result = run_pipeline(persist=args.persist)
+
+    console.print(f"\n[bold green]✓ Pipeline complete in {result['elapsed_ns'] / 1e6:.2f} ms[/bold green]")
+    if args.persist:
+        console.print("[dim]Artifacts saved to ./output/ directory[/dim]")
+
+
+if __name__ == "__main__":
+    main()
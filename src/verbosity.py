@@ -0,0 +1,26 @@
+"""
+Shared verbosity switch for the lab's terminal output.
+
+Rich panels and tables cost milliseconds to lay out, which dwarfs the
+microsecond-scale KEM/AES operations they narrate. The cryptographic
+functions in each phase only build Rich output when `VERBOSE` is set, and
+log their key facts with `logging.debug` (formatted lazily) instead.
+
+    ICARUS_VERBOSE=0 uv run icarus      # or: uv run icarus --quiet
+
+`FAST` drops the demo pacing (sleeps, progress bars) of Phases 4-5 for CI
+and benchmark runs:
+
+    ICARUS_FAST=1 uv run icarus
+"""
+
+import os
+
+VERBOSE = os.environ.get("ICARUS_VERBOSE", "1").strip().lower() not in ("0", "false", "no", "off")
+FAST    = os.environ.get("ICARUS_FAST", "0").strip().lower() not in ("0", "false", "no", "off", "")
+
+
+def set_verbose(enabled: bool):
+    """Toggle narrated Rich output for all phases at runtime."""
+    global VERBOSE
+    VERBOSE = bool(enabled)